@@ -3,8 +3,9 @@
 # pylint: disable=wrong-import-position
 
 import logging
-import pickle
+import json
 import pathlib
+import dataclasses
 import argparse
 import sys
 
@@ -16,9 +17,7 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
-from .setup import setup
-from .teardown import teardown
-from .create_tables import create_tables, test_connection
+from .create_tables import create_tables, pooled_connection, test_connection
 from .etl import (
     copy_to_tables,
     insert_into_tables,
@@ -27,54 +26,65 @@ from .etl import (
 
 from .models import RedshiftConfig
 
+SETUP_OUTPUT_PATH = pathlib.Path(__file__).parent.parent / "setup_output.json"
+
+
+def run_and_save_setup():
+    """Run and save the setup for later use."""
+    # Imported here so other commands skip loading the AWS setup code
+    from .setup import setup  # pylint: disable=import-outside-toplevel
 
-def run_and_pickle_setup():
-    """Run and pickle the setup for later use."""
     redshift_config, role_arn, region = setup()
-    pickle_path = pathlib.Path(__file__).parent.parent / "setup_output.pkl"
 
-    with open(pickle_path, "wb") as file:
-        pickle.dump((redshift_config, role_arn, region), file)
+    with open(SETUP_OUTPUT_PATH, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "cfg": dataclasses.asdict(redshift_config),
+                "role_arn": role_arn,
+                "region": region,
+            },
+            file,
+        )
 
-    logger.info("Setup output saved to %s", pickle_path)
+    logger.info("Setup output saved to %s", SETUP_OUTPUT_PATH)
 
 
-def load_pickled_setup() -> Tuple[RedshiftConfig, str, str]:
+def load_saved_setup() -> Tuple[RedshiftConfig, str, str]:
     """
-    Load the previously pickled Redshift setup output.
+    Load the previously saved Redshift setup output.
 
     Returns
     -------
     Tuple[RedshiftConfig, str, str]
-        (RedshiftConfig, role_arn, region) loaded from pickle.
+        (RedshiftConfig, role_arn, region) loaded from the JSON setup output.
     """
-    pickle_path = pathlib.Path(__file__).parent.parent / "setup_output.pkl"
-
-    logger.info("Loading setup output from %s", pickle_path)
+    logger.info("Loading setup output from %s", SETUP_OUTPUT_PATH)
 
-    with open(pickle_path, "rb") as file:
-        redshift_config, role_arn, region = pickle.load(file)
+    with open(SETUP_OUTPUT_PATH, "r", encoding="utf-8") as file:
+        data = json.load(file)
 
-    return redshift_config, role_arn, region
+    return RedshiftConfig(**data["cfg"]), data["role_arn"], data["region"]
 
 
 def setup_redshift_tables():
     """Run table creation, copy, insert, and validation."""
-    redshift_config, role_arn, region = load_pickled_setup()
+    redshift_config, role_arn, region = load_saved_setup()
 
     logger.info("Attempting connection to %s", redshift_config)
     test_connection(redshift_config, retries=10, delay=5)
 
     create_tables(redshift_config)
-    copy_to_tables(redshift_config, role_arn, region)
-    insert_into_tables(redshift_config)
+
+    with pooled_connection(redshift_config) as conn:
+        copy_to_tables(redshift_config, role_arn, region, conn=conn)
+        insert_into_tables(redshift_config, conn=conn)
 
     logger.info("Redshift setup and ETL complete.")
 
 
 def run_sample_queries():
     """Run the sample queries for the demonstration."""
-    redshift_config, _, _ = load_pickled_setup()
+    redshift_config, _, _ = load_saved_setup()
 
     sample_queries(redshift_config)
 
@@ -82,17 +92,20 @@ def run_sample_queries():
 def run_teardown():
     """
     Run the teardown method to reset the workspace and
-    delete the local pickle file storing Redshift setup information.
+    delete the local file storing Redshift setup information.
     """
-    teardown()
+    # Imported here so other commands skip loading the AWS teardown code
+    from .teardown import teardown  # pylint: disable=import-outside-toplevel
 
-    pickle_path = pathlib.Path(__file__).parent.parent / "setup_output.pkl"
+    teardown()
 
-    if pickle_path.exists():
-        pickle_path.unlink()
-        logger.info("Deleted pickle file at %s", pickle_path)
+    if SETUP_OUTPUT_PATH.exists():
+        SETUP_OUTPUT_PATH.unlink()
+        logger.info("Deleted setup output file at %s", SETUP_OUTPUT_PATH)
     else:
-        logger.warning("Pickle file %s not found. Nothing to delete.", pickle_path)
+        logger.warning(
+            "Setup output file %s not found. Nothing to delete.", SETUP_OUTPUT_PATH
+        )
 
 
 def main():
@@ -103,10 +116,8 @@ def main():
 
     group = parser.add_mutually_exclusive_group(required=True)
 
-    group.add_argument(
-        "--setup", action="store_true", help="Run setup and pickle output"
-    )
-    group.add_argument("--etl", action="store_true", help="Run ETL using pickled setup")
+    group.add_argument("--setup", action="store_true", help="Run setup and save output")
+    group.add_argument("--etl", action="store_true", help="Run ETL using saved setup")
     group.add_argument(
         "--teardown", action="store_true", help="Run teardown to remove resources"
     )
@@ -116,15 +127,13 @@ def main():
 
     args = parser.parse_args()
 
-    pickle_path = pathlib.Path(__file__).parent.parent / "setup_output.pkl"
-
     if args.setup:
         logger.info("Starting setup...")
-        run_and_pickle_setup()
+        run_and_save_setup()
 
     elif args.etl:
-        if not pickle_path.exists():
-            logger.error("Pickle file not found. Please run --setup first.")
+        if not SETUP_OUTPUT_PATH.exists():
+            logger.error("Setup output not found. Please run --setup first.")
             sys.exit(1)
 
         logger.info("Starting ETL process...")
@@ -135,8 +144,8 @@ def main():
         run_teardown()
 
     elif args.sample:
-        if not pickle_path.exists():
-            logger.error("Pickle file not found. Please run --setup and --etl first.")
+        if not SETUP_OUTPUT_PATH.exists():
+            logger.error("Setup output not found. Please run --setup and --etl first.")
             sys.exit(1)
 
         logger.info("Running sample queries...")
@@ -0,0 +1,42 @@
+"""Shared, lazily created configuration and AWS clients"""
+
+import pathlib
+import functools
+import configparser
+
+import boto3
+
+current_dir = pathlib.Path(__file__).parent.parent
+config_path = current_dir / "dwh.cfg"
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> configparser.ConfigParser:
+    """Parse the configuration file on first use and cache the result."""
+    config = configparser.ConfigParser()
+    config.read(config_path)
+    return config
+
+
+@functools.lru_cache(maxsize=1)
+def get_session() -> boto3.Session:
+    """Create the boto3 session on first use so credentials resolve once."""
+    return boto3.Session(region_name=get_config().get("AWS", "REGION"))
+
+
+@functools.lru_cache(maxsize=1)
+def get_iam():
+    """Create the IAM client on first use and cache it."""
+    return get_session().client("iam")
+
+
+@functools.lru_cache(maxsize=1)
+def get_ec2():
+    """Create the EC2 client on first use and cache it."""
+    return get_session().client("ec2")
+
+
+@functools.lru_cache(maxsize=1)
+def get_redshift():
+    """Create the Redshift client on first use and cache it."""
+    return get_session().client("redshift")
@@ -1,10 +1,18 @@
 """Methods used to create tables and insert, update, and copy data"""
 
-from typing import List
+from typing import Any, Iterator, List, Optional, Sequence
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 
 import time
+import uuid
+import random
 import logging
-import psycopg2
+import threading
+import psycopg
+
+from psycopg import ClientCursor, Connection, Cursor
+from psycopg_pool import ConnectionPool
 
 from .models import RedshiftConfig
 
@@ -15,6 +23,58 @@ from .sql_queries import (
 
 logger = logging.getLogger(__name__)
 
+_POOL: Optional[ConnectionPool] = None
+_POOL_CONFIG: Optional[RedshiftConfig] = None
+_POOL_LOCK = threading.Lock()
+
+
+def _backoff(failures: int, delay: float) -> float:
+    """
+    Compute an exponential backoff with jitter, capped at ``delay``.
+
+    Parameters
+    ----------
+    failures : int
+        Number of consecutive failed attempts so far (starting at 1).
+    delay : float
+        Maximum number of seconds to wait before jitter is applied.
+
+    Returns
+    -------
+    float
+        Seconds to wait before the next attempt.
+    """
+    return min(delay, 0.5 * (2 ** (failures - 1))) * (0.5 + random.random())
+
+
+def _log_results(cur: Cursor, batch_size: int = 1000) -> None:
+    """
+    Log the rows returned by the last query, one log record per batch.
+
+    Parameters
+    ----------
+    cur : Cursor
+        A cursor that has just executed a row-returning query.
+    batch_size : int, optional
+        Number of rows fetched and logged at a time. Defaults to 1000.
+    """
+    total = 0
+
+    while True:
+        rows = cur.fetchmany(batch_size)
+        if not rows:
+            break
+
+        logger.info(
+            "Query result rows %d-%d:\n%s",
+            total + 1,
+            total + len(rows),
+            "\n".join(repr(row) for row in rows),
+        )
+        total += len(rows)
+
+    logger.info("Query returned %d rows.", total)
+
 
 def test_connection(config: RedshiftConfig, retries: int = 5, delay: int = 10) -> None:
     """
@@ -27,11 +87,12 @@ def test_connection(config: RedshiftConfig, retries: int = 5, delay: int = 10) -
     retries : int, optional
         Number of retry attempts if the connection fails. Defaults to 5.
     delay : int, optional
-        Seconds to wait between retries. Defaults to 10 seconds.
+        Maximum seconds to wait between retries. Waits start at about half a
+        second and double after each failure. Defaults to 10 seconds.
 
     Raises
     ------
-    psycopg2.OperationalError
+    psycopg.OperationalError
         If unable to connect after the specified number of retries.
     """
     attempt = 1
@@ -46,7 +107,7 @@ def test_connection(config: RedshiftConfig, retries: int = 5, delay: int = 10) -
                 "Attempting to connect to Redshift (Attempt %d/%d)...", attempt, retries
             )
 
-            conn = psycopg2.connect(
+            conn = psycopg.connect(
                 dbname=config.db_name,
                 user=config.username,
                 password=config.password,
@@ -57,13 +118,14 @@ def test_connection(config: RedshiftConfig, retries: int = 5, delay: int = 10) -
             conn.close()
             logger.info("Connection to Redshift successful!")
             return
-        except psycopg2.OperationalError as e:
+        except psycopg.OperationalError as e:
             logger.warning("Connection attempt %d failed: %s", attempt, e)
             attempt += 1
 
             if attempt <= retries:
-                logger.info("Waiting %d seconds before retrying...", delay)
-                time.sleep(delay)
+                wait = _backoff(attempt - 1, delay)
+                logger.info("Waiting %.1f seconds before retrying...", wait)
+                time.sleep(wait)
             else:
                 logger.error(
                     "All connection attempts failed. Redshift may be unavailable."
@@ -71,20 +133,218 @@ def test_connection(config: RedshiftConfig, retries: int = 5, delay: int = 10) -
                 raise e
 
 
-def run_queries(
+def _get_pool(config: RedshiftConfig) -> ConnectionPool:
+    """
+    Return the shared connection pool, creating it on first use.
+
+    The pool is rebuilt if it was created for a different configuration.
+
+    Parameters
+    ----------
+    config : RedshiftConfig
+        Configuration object containing Redshift connection parameters.
+
+    Returns
+    -------
+    ConnectionPool
+        A thread-safe pool of connections to the Redshift cluster.
+    """
+    global _POOL, _POOL_CONFIG  # pylint: disable=global-statement
+
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_CONFIG != config:
+            if _POOL is not None:
+                _POOL.close()
+
+            _POOL = ConnectionPool(
+                min_size=1,
+                max_size=8,
+                kwargs={
+                    "dbname": config.db_name,
+                    "user": config.username,
+                    "password": config.password,
+                    "host": config.redshift_endpoint,
+                    "port": config.redshift_port,
+                    "connect_timeout": 10,
+                },
+                open=True,
+            )
+            _POOL_CONFIG = config
+
+        return _POOL
+
+
+@contextmanager
+def pooled_connection(config: RedshiftConfig) -> Iterator[Connection]:
+    """
+    Borrow a connection from the shared pool and return it when done.
+
+    Parameters
+    ----------
+    config : RedshiftConfig
+        Configuration object containing Redshift connection parameters.
+
+    Yields
+    ------
+    Connection
+        An open connection to the Redshift cluster.
+    """
+    pool = _get_pool(config)
+    conn = pool.getconn()
+
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
+
+
+def _run_pipelined(queries: List[str], conn: Connection, query_type: str) -> bool:
+    """
+    Send every query in pipeline mode before reading any of the results.
+
+    Parameters
+    ----------
+    queries : List[str]
+        A list of SQL queries to be executed sequentially.
+    conn : Connection
+        An open connection with a transaction that is not yet committed.
+    query_type : str
+        A label for the type of queries being run. Used only for logging.
+
+    Returns
+    -------
+    bool
+        True if every query succeeded, False if the batch was rolled back.
+    """
+    logger.info("Running %d %s commands in a pipeline.", len(queries), query_type)
+
+    try:
+        with conn.pipeline():
+            cursors = [conn.execute(query) for query in queries]
+
+        for cur in cursors:
+            if cur.description is not None:
+                _log_results(cur)
+
+    except psycopg.Error as e:
+        logger.warning(
+            "Pipelined %s failed, retrying one query at a time: %s", query_type, e
+        )
+        conn.rollback()
+        return False
+
+    return True
+
+
+def _run_sequential(
+    queries: List[str], conn: Connection, query_type: str, retries: int, delay: int
+) -> bool:
+    """
+    Run queries one at a time in the open transaction, retrying failures.
+
+    Redshift does not support SAVEPOINT, so a failed statement aborts the whole
+    transaction. Before each retry, the statements that already succeeded in
+    this batch are run again.
+
+    Parameters
+    ----------
+    queries : List[str]
+        A list of SQL queries to be executed sequentially.
+    conn : Connection
+        An open connection with a transaction that is not yet committed.
+    query_type : str
+        A label for the type of queries being run. Used only for logging.
+    retries : int
+        Number of attempts per query before the batch is abandoned.
+    delay : int
+        Maximum seconds to wait between retries.
+
+    Returns
+    -------
+    bool
+        True if every query succeeded, False if the batch was rolled back.
+    """
+    executed: List[str] = []
+    log_queries = logger.isEnabledFor(logging.INFO)
+    cur = conn.cursor()
+
+    for query in queries:
+        stripped = query.strip() if log_queries else query
+
+        for attempt in range(1, retries + 1):
+            try:
+                if attempt > 1:
+                    for done in executed:
+                        cur.execute(done)
+
+                logger.info(
+                    "Running %s (Attempt %d/%d):\n%s",
+                    query_type,
+                    attempt,
+                    retries,
+                    stripped,
+                )
+
+                cur.execute(query)
+
+                if cur.description is not None:
+                    _log_results(cur)
+
+                break
+
+            except psycopg.Error as e:
+                logger.warning(
+                    "Error executing %s attempt %d: %s", query_type, attempt, e
+                )
+                conn.rollback()
+
+                if attempt < retries:
+                    wait = _backoff(attempt, delay)
+                    logger.info("Retrying in %.1f seconds...", wait)
+                    time.sleep(wait)
+        else:
+            logger.error(
+                "All attempts to run %s failed. Rolled back the whole batch.",
+                query_type,
+            )
+            cur.close()
+            return False
+
+        executed.append(query)
+        logger.info("%s executed successfully.", query_type)
+
+    cur.close()
+    return True
+
+
+def run_queries(  # pylint: disable=too-many-arguments,too-many-positional-arguments
     queries: List[str],
     config: RedshiftConfig,
     query_type: str = "QUERY",
     retries: int = 3,
     delay: int = 5,
+    conn: Optional[Connection] = None,
 ) -> None:
     """
     Run a list of SQL queries against a Redshift cluster with retry logic.
 
+    All queries run inside a single transaction that is committed once after
+    the last query, rather than committing after every statement. When the
+    client library supports it, a batch of several queries is first sent in
+    pipeline mode so that every statement is submitted before any result is
+    read. If that fails, the batch is rolled back and run one statement at a
+    time with retries.
+
+    Redshift does not support SAVEPOINT, so retrying a failed statement rolls
+    back the transaction and re-runs the statements before it in the batch. If
+    a statement still fails after the last retry, the whole batch is rolled
+    back and nothing is committed. Expensive statements such as COPY should
+    therefore be passed as their own single-statement batches.
+
     Parameters
     ----------
     queries : List[str]
-        A list of SQL queries (e.g., CREATE, DROP, COPY, SELECT statements) to
+        A list of SQL queries (e.g., CREATE, DROP, COPY, INSERT statements) to
         be executed sequentially.
     config : RedshiftConfig
         Configuration object containing Redshift connection parameters.
@@ -94,67 +354,183 @@ def run_queries(
     retries : int, optional
         Number of retry attempts if a query fails. Defaults to 3.
     delay : int, optional
-        Seconds to wait between retries. Defaults to 5 seconds.
+        Maximum seconds to wait between retries. Waits start at about half a
+        second and double after each failure. Defaults to 5 seconds.
+    conn : Connection, optional
+        An open connection to reuse. If omitted, a connection is borrowed from
+        the shared pool for the duration of the call.
     """
+    if conn is None:
+        try:
+            with pooled_connection(config) as pooled_conn:
+                run_queries(queries, config, query_type, retries, delay, pooled_conn)
+        except psycopg.Error as e:
+            logger.error("Could not connect to Redshift: %s", e)
+
+        return
+
     try:
-        conn = psycopg2.connect(
-            dbname=config.db_name,
-            user=config.username,
-            password=config.password,
-            host=config.redshift_endpoint,
-            port=config.redshift_port,
-            connect_timeout=10,
+        # Run the whole batch in a single transaction and commit once at the end
+        conn.autocommit = False
+        logger.info("Connected to Redshift successfully.")
+
+        pipelined = len(queries) > 1 and psycopg.Pipeline.is_supported()
+
+        if pipelined and _run_pipelined(queries, conn, query_type):
+            conn.commit()
+        elif _run_sequential(queries, conn, query_type, retries, delay):
+            conn.commit()
+        else:
+            return
+
+        logger.info("All %s commands executed and committed.", query_type)
+
+    except psycopg.Error as e:
+        logger.error("Could not complete %s commands: %s", query_type, e)
+
+        if not conn.closed:
+            conn.rollback()
+
+
+def run_streaming_queries(
+    queries: List[str],
+    config: RedshiftConfig,
+    conn: Optional[Connection] = None,
+) -> None:
+    """
+    Run SELECT queries through server-side cursors and log their results.
+
+    Results are fetched in chunks rather than held in memory all at once. A
+    query that fails is logged and skipped.
+
+    Parameters
+    ----------
+    queries : List[str]
+        A list of SELECT queries to be executed sequentially.
+    config : RedshiftConfig
+        Configuration object containing Redshift connection parameters.
+    conn : Connection, optional
+        An open connection to reuse. If omitted, a connection is borrowed from
+        the shared pool for the duration of the call.
+    """
+    if conn is None:
+        try:
+            with pooled_connection(config) as pooled_conn:
+                run_streaming_queries(queries, config, pooled_conn)
+        except psycopg.Error as e:
+            logger.error("Could not connect to Redshift: %s", e)
+
+        return
+
+    # Server-side cursors only live inside a transaction
+    conn.autocommit = False
+
+    for query in queries:
+        logger.info("Running ANALYTICS:\n%s", query.strip())
+
+        try:
+            with conn.cursor(name=f"stream_{uuid.uuid4().hex}") as cur:
+                cur.itersize = 10000
+                cur.execute(query)
+                _log_results(cur, batch_size=cur.itersize)
+
+            conn.commit()
+            logger.info("ANALYTICS executed successfully.")
+
+        except psycopg.Error as e:
+            logger.error("Error executing ANALYTICS: %s", e)
+
+            if not conn.closed:
+                conn.rollback()
+
+
+def run_queries_parallel(
+    queries: List[str],
+    config: RedshiftConfig,
+    query_type: str = "QUERY",
+    max_workers: int = 4,
+) -> None:
+    """
+    Run independent SQL queries concurrently, one connection per worker.
+
+    Parameters
+    ----------
+    queries : List[str]
+        A list of SQL queries with no dependencies on one another.
+    config : RedshiftConfig
+        Configuration object containing Redshift connection parameters.
+    query_type : str, optional
+        A label for the type of queries being run. Used only for logging
+        purposes. Defaults to "QUERY".
+    max_workers : int, optional
+        Maximum number of queries to run at once. Defaults to 4.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(
+            executor.map(
+                lambda query: run_queries([query], config, query_type=query_type),
+                queries,
+            )
         )
 
-        cur = conn.cursor()
-        logger.info("Connected to Redshift successfully.")
 
-        for query in queries:
-            attempt = 1
-            success = False
-
-            while attempt <= retries and not success:
-                try:
-                    logger.info(
-                        "Running %s (Attempt %d/%d):\n%s",
-                        query_type,
-                        attempt,
-                        retries,
-                        query.strip(),
-                    )
-
-                    cur.execute(query)
-
-                    if cur.description is not None:
-                        rows = cur.fetchall()
-                        for row in rows:
-                            logger.info("Query Result: %s", row)
-
-                    conn.commit()
-                    logger.info("%s executed successfully.", query_type)
-                    success = True
-
-                except psycopg2.Error as e:
-                    logger.warning(
-                        "Error executing %s attempt %d: %s", query_type, attempt, e
-                    )
-                    attempt += 1
-                    if attempt <= retries:
-                        logger.info("Retrying in %d seconds...", delay)
-                        time.sleep(delay)
-                    else:
-                        logger.error(
-                            "All attempts to run %s failed. Moving to next query.",
-                            query_type,
-                        )
-
-        cur.close()
-        conn.close()
-
-        logger.info("All %s commands executed and connection closed.", query_type)
-
-    except psycopg2.Error as e:
-        logger.error("Could not connect to Redshift: %s", e)
+def run_bulk_insert(
+    sql: str,
+    rows: Sequence[Sequence[Any]],
+    config: RedshiftConfig,
+    page_size: int = 10_000,
+    conn: Optional[Connection] = None,
+) -> None:
+    """
+    Insert client-side rows in multi-row VALUES batches.
+
+    Parameters
+    ----------
+    sql : str
+        An INSERT statement containing a single ``VALUES %s`` placeholder,
+        e.g. ``INSERT INTO users (user_id, level) VALUES %s``.
+    rows : Sequence[Sequence[Any]]
+        The rows to insert, one sequence of column values per row.
+    config : RedshiftConfig
+        Configuration object containing Redshift connection parameters.
+    page_size : int, optional
+        Maximum number of rows sent per statement. Defaults to 10,000.
+    conn : Connection, optional
+        An open connection to reuse. If omitted, a connection is borrowed from
+        the shared pool for the duration of the call.
+    """
+    if conn is None:
+        try:
+            with pooled_connection(config) as pooled_conn:
+                run_bulk_insert(sql, rows, config, page_size, pooled_conn)
+        except psycopg.Error as e:
+            logger.error("Could not connect to Redshift: %s", e)
+
+        return
+
+    # Redshift cannot COPY FROM STDIN, so multi-row VALUES is the fastest
+    # client-side path; larger loads should be staged in S3 and COPY'd.
+    # Parameters are bound client-side to avoid the server's bind limit.
+    try:
+        with ClientCursor(conn) as cur:
+            for start in range(0, len(rows), page_size):
+                page = rows[start : start + page_size]
+                row_sql = "(" + ", ".join(["%s"] * len(page[0])) + ")"
+                values_sql = ", ".join([row_sql] * len(page))
+
+                cur.execute(
+                    sql.replace("%s", values_sql, 1),
+                    [value for row in page for value in row],
+                )
+
+        conn.commit()
+        logger.info("Inserted %d rows.", len(rows))
+
+    except psycopg.Error as e:
+        logger.error("Could not complete bulk insert: %s", e)
+
+        if not conn.closed:
+            conn.rollback()
 
 
 def create_tables(config: RedshiftConfig):
@@ -166,5 +542,6 @@ def create_tables(config: RedshiftConfig):
     config : RedshiftConfig
         Configuration object containing Redshift connection parameters.
     """
-    run_queries(DROP_TABLE_STATEMENTS, config, query_type="DROP")
-    run_queries(CREATE_TABLE_STATEMENTS, config, query_type="CREATE")
+    with pooled_connection(config) as conn:
+        run_queries(DROP_TABLE_STATEMENTS, config, query_type="DROP", conn=conn)
+        run_queries(CREATE_TABLE_STATEMENTS, config, query_type="CREATE", conn=conn)
@@ -1,14 +1,32 @@
 """Module containing all functions necessary for ETL processes"""
 
+from typing import Optional
+
+from psycopg import Connection
+
 from .models import RedshiftConfig
-from .create_tables import run_queries
-from .sql_queries import COPY_STATEMENTS, INSERT_STATEMENTS, SAMPLE_QUERIES
+from .create_tables import run_queries, run_queries_parallel, run_streaming_queries
+from .sql_queries import (
+    ANALYZE_STATEMENTS,
+    COPY_STATEMENTS,
+    INDEPENDENT_INSERTS,
+    DEPENDENT_INSERTS,
+    SAMPLE_QUERIES,
+)
 
 
-def copy_to_tables(config: RedshiftConfig, role_arn: str, region: str):
+def copy_to_tables(
+    config: RedshiftConfig,
+    role_arn: str,
+    region: str,
+    conn: Optional[Connection] = None,
+):
     """
     Bulk copy data into Redshift staging tables from S3.
 
+    Each COPY runs and commits on its own, so a failed COPY is retried without
+    reloading the tables copied before it.
+
     Parameters
     ----------
     config : RedshiftConfig
@@ -17,21 +35,33 @@ def copy_to_tables(config: RedshiftConfig, role_arn: str, region: str):
         The Amazon Resource Name (ARN) of the IAM role that grants Redshift read access to S3.
     region : str
         The AWS region where the S3 bucket is located (e.g., 'us-west-2').
+    conn : Connection, optional
+        An open connection to reuse. If omitted, one is borrowed from the pool.
     """
     copy_stmts_fmt = [stmt.format(role_arn, region) for stmt in COPY_STATEMENTS]
-    run_queries(copy_stmts_fmt, config, query_type="COPY")
+    for query in copy_stmts_fmt:
+        run_queries([query], config, query_type="COPY", conn=conn)
 
 
-def insert_into_tables(config: RedshiftConfig):
+def insert_into_tables(config: RedshiftConfig, conn: Optional[Connection] = None):
     """
     Insert data from staging tables into fact and dimension tables.
 
+    The dimension inserts do not depend on each other and are run concurrently,
+    followed by the songplays fact insert. Table statistics are refreshed
+    afterwards so the query planner sees the loaded data.
+
     Parameters
     ----------
     config : RedshiftConfig
         Configuration object containing Redshift connection parameters.
+    conn : Connection, optional
+        An open connection to reuse for the songplays insert. The concurrent
+        dimension inserts always borrow their own connections from the pool.
     """
-    run_queries(INSERT_STATEMENTS, config, query_type="INSERT")
+    run_queries_parallel(INDEPENDENT_INSERTS, config, query_type="INSERT")
+    run_queries(DEPENDENT_INSERTS, config, query_type="INSERT", conn=conn)
+    run_queries(ANALYZE_STATEMENTS, config, query_type="ANALYZE", conn=conn)
 
 
 def run_sample_queries(config: RedshiftConfig):
@@ -43,4 +73,4 @@ def run_sample_queries(config: RedshiftConfig):
     config : RedshiftConfig
         Configuration object containing Redshift connection parameters.
     """
-    run_queries(SAMPLE_QUERIES, config, query_type="ANALYTICS")
+    run_streaming_queries(SAMPLE_QUERIES, config)
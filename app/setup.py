@@ -2,45 +2,15 @@
 
 import json
 import time
-import pathlib
-import configparser
 import logging
 
 from typing import Tuple
 
-import boto3
-
+from ._aws import get_config, get_ec2, get_iam, get_redshift
 from .models import RedshiftConfig
 
 logger = logging.getLogger(__name__)
 
-current_dir = pathlib.Path(__file__).parent.parent
-config_path = current_dir / "dwh.cfg"
-
-config = configparser.ConfigParser()
-config.read(config_path)
-
-REGION = config.get("AWS", "REGION")
-
-ROLE_NAME = config.get("IAM", "ROLE_NAME")
-USER_NAME = config.get("IAM", "USER_NAME")
-
-SECURITY_GROUP_NAME = config.get("SECURITY", "SECURITY_GROUP_NAME")
-SUBNET_GROUP_NAME = config.get("SECURITY", "SUBNET_GROUP_NAME")
-DEFAULT_VPC_ID = config.get("AWS", "DEFAULT_VPC_ID")
-
-CLUSTER_IDENTIFIER = config.get("CLUSTER", "CLUSTER_IDENTIFIER")
-DB_NAME = config.get("CLUSTER", "DB_NAME")
-MASTER_USERNAME = config.get("CLUSTER", "MASTER_USERNAME")
-MASTER_PASSWORD = config.get("CLUSTER", "MASTER_PASSWORD")
-NODE_TYPE = config.get("CLUSTER", "NODE_TYPE")
-CLUSTER_TYPE = config.get("CLUSTER", "CLUSTER_TYPE")
-PORT = config.getint("CLUSTER", "PORT")
-
-iam_client = boto3.client("iam", region_name=REGION)
-ec2_client = boto3.client("ec2", region_name=REGION)
-redshift_client = boto3.client("redshift", region_name=REGION)
-
 
 def create_iam_role() -> str:
     """
@@ -52,6 +22,8 @@ def create_iam_role() -> str:
         The Amazon Resource Name (ARN) of the created IAM role.
     """
     logger.info("Creating IAM Role...")
+    role_name = get_config().get("IAM", "ROLE_NAME")
+
     assume_role_policy = {
         "Version": "2012-10-17",
         "Statement": [
@@ -63,54 +35,72 @@ def create_iam_role() -> str:
         ],
     }
 
-    role = iam_client.create_role(
-        RoleName=ROLE_NAME,
+    role = get_iam().create_role(
+        RoleName=role_name,
         AssumeRolePolicyDocument=json.dumps(assume_role_policy),
         Description="Role for Redshift to access S3",
     )
 
-    iam_client.attach_role_policy(
-        RoleName=ROLE_NAME, PolicyArn="arn:aws:iam::aws:policy/AmazonS3ReadOnlyAccess"
+    get_iam().attach_role_policy(
+        RoleName=role_name, PolicyArn="arn:aws:iam::aws:policy/AmazonS3ReadOnlyAccess"
     )
 
     role_arn = role["Role"]["Arn"]
     return role_arn
 
 
-def create_security_group():
+def create_security_group() -> Tuple[str, str, str]:
     """
     Create a security group allowing Redshift public access in
     the default VPC.
 
+    Also looks up the VPC's default security group, which the cluster is
+    attached to alongside the new one.
+
     Returns
     -------
-    Tuple[str, str]
-        A tuple containing the VPC ID and the Security Group ID created.
+    Tuple[str, str, str]
+        A tuple containing the VPC ID, the Security Group ID created, and the
+        default Security Group ID of the VPC.
     """
     logger.info("Creating Security Group...")
+    port = get_config().getint("CLUSTER", "PORT")
 
-    response = ec2_client.describe_vpcs()
+    response = get_ec2().describe_vpcs()
     vpc_id = response["Vpcs"][0]["VpcId"]
 
-    security_group = ec2_client.create_security_group(
-        GroupName=SECURITY_GROUP_NAME,
+    security_group = get_ec2().create_security_group(
+        GroupName=get_config().get("SECURITY", "SECURITY_GROUP_NAME"),
         Description="Security Group for Redshift allowing public access",
         VpcId=vpc_id,
     )
 
-    ec2_client.authorize_security_group_ingress(
+    get_ec2().authorize_security_group_ingress(
         GroupId=security_group["GroupId"],
         IpPermissions=[
             {
                 "IpProtocol": "tcp",
-                "FromPort": PORT,
-                "ToPort": PORT,
+                "FromPort": port,
+                "ToPort": port,
                 "IpRanges": [{"CidrIp": "0.0.0.0/0"}],
             }
         ],
     )
 
-    return vpc_id, security_group["GroupId"]
+    response = get_ec2().describe_security_groups(
+        Filters=[
+            {"Name": "vpc-id", "Values": [vpc_id]},
+            {"Name": "group-name", "Values": ["default"]},
+        ]
+    )
+
+    if not response["SecurityGroups"]:
+        raise ResourceWarning("Default Security Group not found in the VPC.")
+
+    default_sg_id = response["SecurityGroups"][0]["GroupId"]
+    logger.info("Found Default Security Group ID: %s", default_sg_id)
+
+    return vpc_id, security_group["GroupId"], default_sg_id
 
 
 def create_subnet_group(vpc_id: str):
@@ -124,29 +114,55 @@ def create_subnet_group(vpc_id: str):
     """
     logger.info("Creating Subnet Group...")
 
-    subnets = ec2_client.describe_subnets(
+    subnets = get_ec2().describe_subnets(
         Filters=[{"Name": "vpc-id", "Values": [vpc_id]}]
     )
 
     subnet_ids = [subnet["SubnetId"] for subnet in subnets["Subnets"]]
 
-    redshift_client.create_cluster_subnet_group(
-        ClusterSubnetGroupName=SUBNET_GROUP_NAME,
+    get_redshift().create_cluster_subnet_group(
+        ClusterSubnetGroupName=get_config().get("SECURITY", "SUBNET_GROUP_NAME"),
         Description="Subnet group for Redshift cluster",
         SubnetIds=subnet_ids,
     )
 
-    response = redshift_client.describe_cluster_subnet_groups()
 
-    logger.info(
-        "Current Subnet Groups: %s",
-        [sg["ClusterSubnetGroupName"] for sg in response["ClusterSubnetGroups"]],
+def wait_for_subnet_group(attempts: int = 10, delay: int = 1) -> None:
+    """
+    Poll until the new subnet group is visible to the Redshift API.
+
+    Parameters
+    ----------
+    attempts : int, optional
+        Maximum number of times to check for the subnet group. Defaults to 10.
+    delay : int, optional
+        Seconds to wait between checks. Defaults to 1 second.
+    """
+    subnet_group_name = get_config().get("SECURITY", "SUBNET_GROUP_NAME")
+
+    for _ in range(attempts):
+        response = get_redshift().describe_cluster_subnet_groups()
+
+        if any(
+            group["ClusterSubnetGroupName"] == subnet_group_name
+            for group in response["ClusterSubnetGroups"]
+        ):
+            logger.info("Subnet Group %s is available.", subnet_group_name)
+            return
+
+        logger.info("Waiting for Subnet Group %s...", subnet_group_name)
+        time.sleep(delay)
+
+    logger.warning(
+        "Subnet Group %s not visible yet; launching cluster anyway.", subnet_group_name
     )
 
 
-def launch_redshift_cluster(role_arn: str, security_group_id: str) -> str:
+def launch_redshift_cluster(
+    role_arn: str, security_group_id: str, default_sg_id: str
+) -> str:
     """
-    Launch a Redshift cluster using the provided IAM role and security group.
+    Launch a Redshift cluster using the provided IAM role and security groups.
 
     Parameters
     ----------
@@ -154,6 +170,8 @@ def launch_redshift_cluster(role_arn: str, security_group_id: str) -> str:
         The ARN of the IAM role to associate with the Redshift cluster.
     security_group_id : str
         The ID of the security group to attach to the Redshift cluster.
+    default_sg_id : str
+        The ID of the VPC's default security group, also attached to the cluster.
 
     Returns
     -------
@@ -161,33 +179,22 @@ def launch_redshift_cluster(role_arn: str, security_group_id: str) -> str:
         The endpoint address of the launched Redshift cluster.
     """
     logger.info("Launching Redshift Cluster...")
-
-    response = ec2_client.describe_security_groups(
-        Filters=[
-            {"Name": "vpc-id", "Values": [DEFAULT_VPC_ID]},
-            {"Name": "group-name", "Values": ["default"]},
-        ]
-    )
-
-    if not response["SecurityGroups"]:
-        raise ResourceWarning("Default Security Group not found in the VPC.")
-
-    default_sg_id = response["SecurityGroups"][0]["GroupId"]
-    logger.info("Found Default Security Group ID: %s", default_sg_id)
+    config = get_config()
+    cluster_identifier = config.get("CLUSTER", "CLUSTER_IDENTIFIER")
 
     vpc_security_group_ids = [security_group_id, default_sg_id]
 
-    redshift_client.create_cluster(
-        ClusterIdentifier=CLUSTER_IDENTIFIER,
+    get_redshift().create_cluster(
+        ClusterIdentifier=cluster_identifier,
         NodeType="dc2.large",
-        MasterUsername=MASTER_USERNAME,
-        MasterUserPassword=MASTER_PASSWORD,
-        DBName=DB_NAME,
+        MasterUsername=config.get("CLUSTER", "MASTER_USERNAME"),
+        MasterUserPassword=config.get("CLUSTER", "MASTER_PASSWORD"),
+        DBName=config.get("CLUSTER", "DB_NAME"),
         ClusterType="single-node",
         VpcSecurityGroupIds=vpc_security_group_ids,
-        ClusterSubnetGroupName=SUBNET_GROUP_NAME,
+        ClusterSubnetGroupName=config.get("SECURITY", "SUBNET_GROUP_NAME"),
         IamRoles=[role_arn],
-        Port=PORT,
+        Port=config.getint("CLUSTER", "PORT"),
         PubliclyAccessible=True,
     )
 
@@ -195,13 +202,13 @@ def launch_redshift_cluster(role_arn: str, security_group_id: str) -> str:
         "Waiting for cluster to become available (this may take a few minutes)..."
     )
 
-    waiter = redshift_client.get_waiter("cluster_available")
-    waiter.wait(ClusterIdentifier=CLUSTER_IDENTIFIER)
+    waiter = get_redshift().get_waiter("cluster_available")
+    waiter.wait(ClusterIdentifier=cluster_identifier)
 
     logger.info("Cluster is now available!")
 
-    cluster_info = redshift_client.describe_clusters(
-        ClusterIdentifier=CLUSTER_IDENTIFIER
+    cluster_info = get_redshift().describe_clusters(
+        ClusterIdentifier=cluster_identifier
     )
 
     endpoint = cluster_info["Clusters"][0]["Endpoint"]["Address"]
@@ -221,24 +228,24 @@ def setup() -> Tuple[RedshiftConfig, str, str]:
     Tuple[RedshiftConfig, str, str]
         A tuple containing the RedshiftConfig object, the IAM role ARN, and the AWS region.
     """
+    config = get_config()
+
     role_arn = create_iam_role()
-    vpc_id, security_group_id = create_security_group()
+    vpc_id, security_group_id, default_sg_id = create_security_group()
 
     create_subnet_group(vpc_id)
-    logger.info("Waiting 15 seconds for database to come online...")
-
-    time.sleep(15)
+    wait_for_subnet_group()
 
-    endpoint = launch_redshift_cluster(role_arn, security_group_id)
+    endpoint = launch_redshift_cluster(role_arn, security_group_id, default_sg_id)
     logger.info("Setup complete! Redshift is ready at %s", endpoint)
 
     return (
         RedshiftConfig(
-            username=MASTER_USERNAME,
-            password=MASTER_PASSWORD,
+            username=config.get("CLUSTER", "MASTER_USERNAME"),
+            password=config.get("CLUSTER", "MASTER_PASSWORD"),
             redshift_endpoint=endpoint,
-            db_name=DB_NAME,
+            db_name=config.get("CLUSTER", "DB_NAME"),
         ),
         role_arn,
-        REGION,
+        config.get("AWS", "REGION"),
     )
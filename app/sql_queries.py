@@ -6,7 +6,7 @@ DROP_SONGS_TABLE = "DROP TABLE IF EXISTS songs;"
 DROP_ARTISTS_TABLE = "DROP TABLE IF EXISTS artists;"
 DROP_TIME_TABLE = "DROP TABLE IF EXISTS time;"
 DROP_STAGING_SONGS_TABLE = "DROP TABLE IF EXISTS staging_songs;"
-DROP_STAGING_EVENTS_TABLE = "DROP TABLE IF EXISTS staging_events;"
+DROP_STAGING_EVENTS_TABLE = "DROP TABLE IF EXISTS staging_logs;"
 
 DROP_TABLE_STATEMENTS = [
     DROP_SONGPLAYS_TABLE,
@@ -23,7 +23,10 @@ COPY_STAGING_SONGS = """
     FROM 's3://udacity-dend/song_data/'
     IAM_ROLE '{}'
     FORMAT AS JSON 'auto'
-    REGION '{}';
+    REGION '{}'
+    COMPUPDATE OFF
+    STATUPDATE OFF
+    TRUNCATECOLUMNS;
 """
 
 COPY_STAGING_LOGS = """
@@ -31,108 +34,114 @@ COPY_STAGING_LOGS = """
     FROM 's3://udacity-dend/log_data/'
     IAM_ROLE '{}'
     FORMAT AS JSON 's3://udacity-dend/log_json_path.json'
-    REGION '{}';
+    REGION '{}'
+    COMPUPDATE OFF
+    STATUPDATE OFF
+    TRUNCATECOLUMNS;
 """
 
 COPY_STATEMENTS = [COPY_STAGING_SONGS, COPY_STAGING_LOGS]
 
 CREATE_STAGING_SONGS_TABLE = """
     CREATE TABLE IF NOT EXISTS staging_songs (
-        num_songs INT,
-        artist_id VARCHAR,
-        artist_latitude FLOAT,
-        artist_longitude FLOAT,
-        artist_location VARCHAR,
-        artist_name VARCHAR,
-        song_id VARCHAR,
-        title VARCHAR,
-        duration FLOAT,
-        year INT
+        num_songs INT ENCODE AZ64,
+        artist_id VARCHAR ENCODE ZSTD,
+        artist_latitude FLOAT ENCODE ZSTD,
+        artist_longitude FLOAT ENCODE ZSTD,
+        artist_location VARCHAR ENCODE ZSTD,
+        artist_name VARCHAR ENCODE RAW,
+        song_id VARCHAR ENCODE ZSTD,
+        title VARCHAR ENCODE RAW,
+        duration FLOAT ENCODE ZSTD,
+        year INT ENCODE AZ64
     )
-    DISTSTYLE EVEN;
+    DISTKEY(title)
+    COMPOUND SORTKEY(title, artist_name);
 """
 
 CREATE_STAGING_EVENTS_TABLE = """
     CREATE TABLE IF NOT EXISTS staging_logs (
-        artist VARCHAR,
-        auth VARCHAR,
-        firstName VARCHAR,
-        gender VARCHAR(1),
-        itemInSession INT,
-        lastName VARCHAR,
-        length FLOAT,
-        level VARCHAR,
-        location VARCHAR,
-        method VARCHAR,
-        page VARCHAR,
-        registration BIGINT,
-        sessionId INT,
-        song VARCHAR,
-        status INT,
-        ts BIGINT,
-        userAgent VARCHAR,
-        userId INT
+        artist VARCHAR ENCODE RAW,
+        auth VARCHAR ENCODE BYTEDICT,
+        firstName VARCHAR ENCODE ZSTD,
+        gender VARCHAR(1) ENCODE BYTEDICT,
+        itemInSession INT ENCODE AZ64,
+        lastName VARCHAR ENCODE ZSTD,
+        length FLOAT ENCODE ZSTD,
+        level VARCHAR ENCODE BYTEDICT,
+        location VARCHAR ENCODE ZSTD,
+        method VARCHAR ENCODE BYTEDICT,
+        page VARCHAR ENCODE BYTEDICT,
+        registration BIGINT ENCODE AZ64,
+        sessionId INT ENCODE AZ64,
+        song VARCHAR ENCODE RAW,
+        status INT ENCODE AZ64,
+        ts BIGINT ENCODE AZ64,
+        userAgent VARCHAR ENCODE ZSTD,
+        userId INT ENCODE AZ64
     )
-    DISTSTYLE EVEN;
+    DISTSTYLE EVEN
+    COMPOUND SORTKEY(song, artist);
 """
 
 CREATE_SONGPLAYS_TABLE = """
     CREATE TABLE IF NOT EXISTS songplays (
-        songplay_id BIGINT IDENTITY(0,1) PRIMARY KEY,
-        start_time TIMESTAMP NOT NULL SORTKEY,
-        user_id INT NOT NULL,
-        level VARCHAR,
-        song_id VARCHAR,
-        artist_id VARCHAR,
-        session_id INT,
-        location VARCHAR,
-        user_agent VARCHAR
+        songplay_id BIGINT IDENTITY(0,1) ENCODE AZ64 PRIMARY KEY,
+        start_time TIMESTAMP ENCODE RAW NOT NULL,
+        user_id INT ENCODE AZ64 NOT NULL,
+        level VARCHAR ENCODE BYTEDICT,
+        song_id VARCHAR ENCODE ZSTD,
+        artist_id VARCHAR ENCODE ZSTD,
+        session_id INT ENCODE AZ64,
+        location VARCHAR ENCODE ZSTD,
+        user_agent VARCHAR ENCODE ZSTD
     )
-    DISTSTYLE EVEN;
+    DISTSTYLE EVEN
+    SORTKEY(start_time);
 """
 
 CREATE_USERS_TABLE = """
     CREATE TABLE IF NOT EXISTS users (
-        user_id INT PRIMARY KEY SORTKEY,
-        first_name VARCHAR,
-        last_name VARCHAR,
-        gender VARCHAR(1),
-        level VARCHAR
+        user_id INT ENCODE RAW PRIMARY KEY SORTKEY,
+        first_name VARCHAR ENCODE ZSTD,
+        last_name VARCHAR ENCODE ZSTD,
+        gender VARCHAR(1) ENCODE BYTEDICT,
+        level VARCHAR ENCODE BYTEDICT
     )
     DISTSTYLE ALL;
 """
 
 CREATE_SONGS_TABLE = """
     CREATE TABLE IF NOT EXISTS songs (
-        song_id VARCHAR PRIMARY KEY SORTKEY,
-        title VARCHAR,
-        artist_id VARCHAR,
-        year INT,
-        duration FLOAT
+        song_id VARCHAR ENCODE RAW PRIMARY KEY SORTKEY,
+        title VARCHAR ENCODE ZSTD,
+        artist_id VARCHAR ENCODE ZSTD,
+        year INT ENCODE AZ64,
+        duration FLOAT ENCODE ZSTD
     )
     DISTSTYLE ALL;
 """
 
 CREATE_ARTISTS_TABLE = """
     CREATE TABLE IF NOT EXISTS artists (
-        artist_id VARCHAR PRIMARY KEY SORTKEY,
-        name VARCHAR,
-        location VARCHAR,
-        latitude FLOAT,
-        longitude FLOAT
+        artist_id VARCHAR ENCODE RAW PRIMARY KEY SORTKEY,
+        name VARCHAR ENCODE ZSTD,
+        location VARCHAR ENCODE ZSTD,
+        latitude FLOAT ENCODE ZSTD,
+        longitude FLOAT ENCODE ZSTD
     )
     DISTSTYLE ALL;
 """
 
 CREATE_TIME_TABLE = """
     CREATE TABLE IF NOT EXISTS time (
-        start_time TIMESTAMP PRIMARY KEY SORTKEY,
-        hour INT,
-        day INT,
-        week INT,
-        month INT,
-        year INT,
-        weekday INT
+        start_time TIMESTAMP ENCODE RAW PRIMARY KEY SORTKEY,
+        hour INT ENCODE AZ64,
+        day INT ENCODE AZ64,
+        week INT ENCODE AZ64,
+        month INT ENCODE AZ64,
+        year INT ENCODE AZ64,
+        weekday INT ENCODE AZ64
     )
     DISTSTYLE ALL;
 """
@@ -151,86 +160,146 @@ INSERT_SONGPLAYS_TABLE = """
     INSERT INTO songplays (
         start_time, user_id, level, song_id, artist_id, session_id, location, user_agent
     )
+    WITH events AS (
+        SELECT
+            TIMESTAMP 'epoch' + (se.ts / 1000) * INTERVAL '1 second' AS start_time,
+            se.userId,
+            se.level,
+            se.song,
+            se.artist,
+            se.sessionId,
+            se.location,
+            se.userAgent
+        FROM staging_logs se
+        WHERE se.artist IS NOT NULL
+    )
     SELECT
-        TIMESTAMP 'epoch' + (se.ts / 1000) * INTERVAL '1 second' AS start_time,
-        se.userId AS user_id,
-        se.level,
+        e.start_time,
+        e.userId AS user_id,
+        e.level,
         ss.song_id,
         ss.artist_id,
-        se.sessionId AS session_id,
-        se.location,
-        se.userAgent AS user_agent
-    FROM staging_logs se
+        e.sessionId AS session_id,
+        e.location,
+        e.userAgent AS user_agent
+    FROM events e
     LEFT JOIN staging_songs ss
-        ON se.song = ss.title
-        AND se.artist = ss.artist_name
-    WHERE se.artist IS NOT NULL;
+        ON e.song = ss.title
+        AND e.artist = ss.artist_name;
 """
 
 INSERT_USERS_TABLE = """
     INSERT INTO users (
         user_id, first_name, last_name, gender, level
     )
-    SELECT DISTINCT
-        se.userId,
-        se.firstName,
-        se.lastName,
-        se.gender,
-        se.level
-    FROM staging_logs se
-    WHERE se.userId IS NOT NULL;
+    SELECT
+        u.userId,
+        u.firstName,
+        u.lastName,
+        u.gender,
+        u.level
+    FROM (
+        SELECT
+            se.userId,
+            se.firstName,
+            se.lastName,
+            se.gender,
+            se.level,
+            ROW_NUMBER() OVER (PARTITION BY se.userId ORDER BY se.ts DESC) AS rn
+        FROM staging_logs se
+        WHERE se.userId IS NOT NULL
+    ) u
+    WHERE u.rn = 1;
 """
 
 INSERT_SONGS_TABLE = """
     INSERT INTO songs (
         song_id, title, artist_id, year, duration
     )
-    SELECT DISTINCT
-        ss.song_id,
-        ss.title,
-        ss.artist_id,
-        ss.year,
-        ss.duration
-    FROM staging_songs ss
-    WHERE ss.song_id IS NOT NULL;
+    SELECT
+        s.song_id,
+        s.title,
+        s.artist_id,
+        s.year,
+        s.duration
+    FROM (
+        SELECT
+            ss.song_id,
+            ss.title,
+            ss.artist_id,
+            ss.year,
+            ss.duration,
+            ROW_NUMBER() OVER (PARTITION BY ss.song_id ORDER BY ss.title) AS rn
+        FROM staging_songs ss
+        WHERE ss.song_id IS NOT NULL
+    ) s
+    WHERE s.rn = 1;
 """
 
 INSERT_ARTISTS_TABLE = """
     INSERT INTO artists (
         artist_id, name, location, latitude, longitude
     )
-    SELECT DISTINCT
-        ss.artist_id,
-        ss.artist_name,
-        ss.artist_location,
-        ss.artist_latitude,
-        ss.artist_longitude
-    FROM staging_songs ss
-    WHERE ss.artist_id IS NOT NULL;
+    SELECT
+        a.artist_id,
+        a.artist_name,
+        a.artist_location,
+        a.artist_latitude,
+        a.artist_longitude
+    FROM (
+        SELECT
+            ss.artist_id,
+            ss.artist_name,
+            ss.artist_location,
+            ss.artist_latitude,
+            ss.artist_longitude,
+            ROW_NUMBER() OVER (
+                PARTITION BY ss.artist_id ORDER BY ss.artist_name
+            ) AS rn
+        FROM staging_songs ss
+        WHERE ss.artist_id IS NOT NULL
+    ) a
+    WHERE a.rn = 1;
 """
 
 INSERT_TIME_TABLE = """
     INSERT INTO time (
         start_time, hour, day, week, month, year, weekday
     )
-    SELECT DISTINCT
-        TIMESTAMP 'epoch' + (se.ts / 1000) * INTERVAL '1 second' AS start_time,
-        EXTRACT(hour FROM TIMESTAMP 'epoch' + (se.ts / 1000) * INTERVAL '1 second') AS hour,
-        EXTRACT(day FROM TIMESTAMP 'epoch' + (se.ts / 1000) * INTERVAL '1 second') AS day,
-        EXTRACT(week FROM TIMESTAMP 'epoch' + (se.ts / 1000) * INTERVAL '1 second') AS week,
-        EXTRACT(month FROM TIMESTAMP 'epoch' + (se.ts / 1000) * INTERVAL '1 second') AS month,
-        EXTRACT(year FROM TIMESTAMP 'epoch' + (se.ts / 1000) * INTERVAL '1 second') AS year,
-        EXTRACT(weekday FROM TIMESTAMP 'epoch' + (se.ts / 1000) * INTERVAL '1 second') AS weekday
-    FROM staging_logs se
-    WHERE se.artist IS NOT NULL;
+    WITH t AS (
+        SELECT DISTINCT
+            TIMESTAMP 'epoch' + (se.ts / 1000) * INTERVAL '1 second' AS start_time
+        FROM staging_logs se
+        WHERE se.artist IS NOT NULL
+    )
+    SELECT
+        t.start_time,
+        EXTRACT(hour FROM t.start_time) AS hour,
+        EXTRACT(day FROM t.start_time) AS day,
+        EXTRACT(week FROM t.start_time) AS week,
+        EXTRACT(month FROM t.start_time) AS month,
+        EXTRACT(year FROM t.start_time) AS year,
+        EXTRACT(weekday FROM t.start_time) AS weekday
+    FROM t;
 """
 
-INSERT_STATEMENTS = [
+INDEPENDENT_INSERTS = [
     INSERT_USERS_TABLE,
     INSERT_SONGS_TABLE,
     INSERT_ARTISTS_TABLE,
     INSERT_TIME_TABLE,
-    INSERT_SONGPLAYS_TABLE,
+]
+
+DEPENDENT_INSERTS = [INSERT_SONGPLAYS_TABLE]
+
+INSERT_STATEMENTS = INDEPENDENT_INSERTS + DEPENDENT_INSERTS
+
+ANALYZE_STATEMENTS = [
+    "ANALYZE songplays;",
+    "ANALYZE users;",
+    "ANALYZE songs;",
+    "ANALYZE artists;",
+    "ANALYZE time;",
 ]
 
 TOP_PLAYED_SONGS_QUERY = """
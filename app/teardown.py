@@ -2,40 +2,26 @@
 
 # pylint: disable=broad-exception-caught
 
-import pathlib
-import configparser
 import logging
-import boto3
 
-logger = logging.getLogger(__name__)
-
-current_dir = pathlib.Path(__file__).parent.parent
-config_path = current_dir / "dwh.cfg"
+from concurrent.futures import ThreadPoolExecutor
 
-config = configparser.ConfigParser()
-config.read(config_path)
+from ._aws import get_config, get_ec2, get_iam, get_redshift
 
-ROLE_NAME = config.get("IAM", "ROLE_NAME")
-USER_NAME = config.get("IAM", "USER_NAME")
-SECURITY_GROUP_NAME = config.get("SECURITY", "SECURITY_GROUP_NAME")
-SUBNET_GROUP_NAME = config.get("SECURITY", "SUBNET_GROUP_NAME")
-CLUSTER_IDENTIFIER = config.get("CLUSTER", "CLUSTER_IDENTIFIER")
-
-redshift_client = boto3.client("redshift")
-iam_client = boto3.client("iam")
-ec2_client = boto3.client("ec2")
+logger = logging.getLogger(__name__)
 
 
 def delete_redshift_cluster():
     """Delete Redshift Cluster"""
     logger.info("Deleting Redshift Cluster...")
     try:
-        redshift_client.delete_cluster(
-            ClusterIdentifier=CLUSTER_IDENTIFIER, SkipFinalClusterSnapshot=True
+        cluster_identifier = get_config().get("CLUSTER", "CLUSTER_IDENTIFIER")
+        get_redshift().delete_cluster(
+            ClusterIdentifier=cluster_identifier, SkipFinalClusterSnapshot=True
         )
         logger.info("Waiting for Redshift Cluster to be deleted...")
-        waiter = redshift_client.get_waiter("cluster_deleted")
-        waiter.wait(ClusterIdentifier=CLUSTER_IDENTIFIER)
+        waiter = get_redshift().get_waiter("cluster_deleted")
+        waiter.wait(ClusterIdentifier=cluster_identifier)
         logger.info("Redshift Cluster deleted.")
     except Exception as e:
         logger.warning("Error encountered while attempting Redshift cluster deletion")
@@ -46,8 +32,8 @@ def delete_subnet_group():
     """Delete Subnet Group"""
     logger.info("Deleting Cluster Subnet Group...")
     try:
-        redshift_client.delete_cluster_subnet_group(
-            ClusterSubnetGroupName=SUBNET_GROUP_NAME
+        get_redshift().delete_cluster_subnet_group(
+            ClusterSubnetGroupName=get_config().get("SECURITY", "SUBNET_GROUP_NAME")
         )
         logger.info("Cluster Subnet Group deleted.")
     except Exception as e:
@@ -59,11 +45,12 @@ def delete_iam_role():
     """Detach Policies and Delete IAM Role"""
     logger.info("Detaching policies and deleting IAM Role...")
     try:
-        iam_client.detach_role_policy(
-            RoleName=ROLE_NAME,
+        role_name = get_config().get("IAM", "ROLE_NAME")
+        get_iam().detach_role_policy(
+            RoleName=role_name,
             PolicyArn="arn:aws:iam::aws:policy/AmazonS3ReadOnlyAccess",
         )
-        iam_client.delete_role(RoleName=ROLE_NAME)
+        get_iam().delete_role(RoleName=role_name)
         logger.info("IAM Role deleted.")
     except Exception as e:
         logger.warning("Error encountered while attempting to delete IAM role")
@@ -74,11 +61,12 @@ def delete_security_group():
     """Delete Security Group"""
     logger.info("Deleting Security Group...")
     try:
-        groups = ec2_client.describe_security_groups(
-            Filters=[{"Name": "group-name", "Values": [SECURITY_GROUP_NAME]}]
+        security_group_name = get_config().get("SECURITY", "SECURITY_GROUP_NAME")
+        groups = get_ec2().describe_security_groups(
+            Filters=[{"Name": "group-name", "Values": [security_group_name]}]
         )
         for group in groups["SecurityGroups"]:
-            ec2_client.delete_security_group(GroupId=group["GroupId"])
+            get_ec2().delete_security_group(GroupId=group["GroupId"])
         logger.info("Security Group deleted.")
     except Exception as e:
         logger.warning("Error encountered while attempting to delete security group")
@@ -86,11 +74,24 @@ def delete_security_group():
 
 
 def teardown():
-    """Run teardown steps in order"""
-    delete_redshift_cluster()
-    delete_subnet_group()
-    delete_iam_role()
-    delete_security_group()
+    """
+    Run teardown steps, deleting the IAM role while the cluster is deleted.
+
+    The subnet group and security group stay attached to the cluster until it
+    is gone, so they are deleted only after the cluster waiter returns.
+    """
+    # Build the clients up front; creating them concurrently from the shared
+    # boto3 session is not thread-safe.
+    get_iam()
+    get_redshift()
+    get_ec2()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(delete_iam_role)
+
+        delete_redshift_cluster()
+        delete_subnet_group()
+        delete_security_group()
 
     logger.info(
         "Teardown complete! IAM user still exists; delete from console if necessary"